@@ -2,17 +2,234 @@
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import logging
-from dataclasses import dataclass
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-import openpyxl
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from xml.etree import ElementTree
+
+import numpy as np
 import pandas as pd
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import range_boundaries
+from pandas.api.types import infer_dtype, is_datetime64_any_dtype, is_numeric_dtype
 
 logger = logging.getLogger(__name__)
 
+# (absolute path, st_mtime_ns, st_size) - changes whenever the file is rewritten
+FileKey = Tuple[str, int, int]
+
+
+def _detect_excel_engine() -> Optional[str]:
+    """Prefer the Rust-based calamine reader when it is installed and supported."""
+    if importlib.util.find_spec("python_calamine") is None:
+        return None
+
+    # pandas gained engine="calamine" in 2.2
+    major, minor = (int(part) for part in pd.__version__.split(".")[:2])
+    return "calamine" if (major, minor) >= (2, 2) else None
+
+
+# None lets pandas pick its default reader (openpyxl for .xlsx, xlrd for .xls)
+_EXCEL_ENGINE = _detect_excel_engine()
+
+MAX_SHEET_READ_WORKERS = 8
+
+WORKBOOK_CACHE_MAX_ENTRIES = 8
+WORKBOOK_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+@dataclass
+class _CachedWorkbook:
+    """Sheets parsed so far from one version of a workbook."""
+
+    sheet_names: Optional[List[str]] = None
+    sheets: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    size: int = 0
+
+
+class _WorkbookCache:
+    """Process-local LRU cache of parsed sheets bounded by workbook count and bytes.
+
+    Sheets are added to their workbook's entry as they are parsed, so reading
+    one sheet never pays for the rest of the workbook.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[FileKey, _CachedWorkbook]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: FileKey) -> Tuple[Optional[List[str]], Dict[str, pd.DataFrame]]:
+        """Return the known sheet names (if any) and a copy of the parsed sheets."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, {}
+            self._entries.move_to_end(key)
+            return entry.sheet_names, dict(entry.sheets)
+
+    def put(
+        self,
+        key: FileKey,
+        sheet_names: List[str],
+        sheets: Mapping[str, pd.DataFrame],
+    ) -> None:
+        """Add freshly parsed sheets to the entry for ``key``."""
+        with self._lock:
+            # Older versions of the same file can never be hit again
+            for stale in [k for k in self._entries if k[0] == key[0] and k != key]:
+                self._total_bytes -= self._entries.pop(stale).size
+
+            entry = self._entries.setdefault(key, _CachedWorkbook())
+            self._entries.move_to_end(key)
+            entry.sheet_names = list(sheet_names)
+            for name, df in sheets.items():
+                if name not in entry.sheets:
+                    entry.sheets[name] = df
+                    entry.size += int(df.memory_usage(deep=True).sum())
+            self._total_bytes = sum(cached.size for cached in self._entries.values())
+
+            if entry.size > self.max_bytes:
+                logger.info("Workbook %s too large to cache (%s bytes)", key[0], entry.size)
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_workbook_cache = _WorkbookCache(WORKBOOK_CACHE_MAX_ENTRIES, WORKBOOK_CACHE_MAX_BYTES)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_path(file_path: Union[str, Path]) -> Tuple[Path, str]:
+    """Parse a user supplied path once; returns it with its lower-cased suffix."""
+    path = Path(file_path)
+
+    if not path.is_absolute():
+        raise ValueError("Please provide an absolute path to the Excel file.")
+
+    return path, path.suffix.lower()
+
+
+def _parse_sheets(path: Path, sheet_names: List[str]) -> Dict[str, pd.DataFrame]:
+    """Parse several sheets through one shared ``pd.ExcelFile`` handle."""
+    with pd.ExcelFile(path, engine=_EXCEL_ENGINE) as excel_file:
+        return {name: excel_file.parse(name) for name in sheet_names}
+
+
+def _read_missing_sheets(
+    path: Path,
+    parsed: Mapping[str, pd.DataFrame],
+) -> Tuple[List[str], Dict[str, pd.DataFrame]]:
+    """Parse every sheet not in ``parsed``, in parallel when the engine allows it.
+
+    Returns the workbook's sheet names together with the newly parsed sheets.
+    """
+    with pd.ExcelFile(path, engine=_EXCEL_ENGINE) as excel_file:
+        sheet_names = list(excel_file.sheet_names)
+        missing = [name for name in sheet_names if name not in parsed]
+        workers = min(MAX_SHEET_READ_WORKERS, len(missing), os.cpu_count() or 1)
+
+        # openpyxl/xlrd readers are pure Python and hold the GIL; keep them serial
+        if _EXCEL_ENGINE != "calamine" or workers < 2:
+            return sheet_names, {name: excel_file.parse(name) for name in missing}
+
+    # A calamine handle cannot be shared between threads, so each worker opens
+    # one and parses a round-robin share of the sheets through it
+    groups = [missing[offset::workers] for offset in range(workers)]
+    fresh: Dict[str, pd.DataFrame] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(_parse_sheets, [path] * workers, groups):
+            fresh.update(part)
+
+    return sheet_names, fresh
+
+
+def _read_sheet_names_from_zip(path_str: str) -> Optional[Tuple[str, ...]]:
+    """Read sheet names straight from ``xl/workbook.xml`` of an OOXML package.
+
+    Returns ``None`` when the file is not laid out as expected so callers can
+    fall back to a full reader.
+    """
+    if not zipfile.is_zipfile(path_str):
+        return None
+
+    with zipfile.ZipFile(path_str) as archive:
+        try:
+            entry = archive.open("xl/workbook.xml")
+        except KeyError:
+            return None
+
+        names: List[str] = []
+        with entry:
+            # Match on the local name so both transitional and strict OOXML work
+            for _, element in ElementTree.iterparse(entry):
+                tag = element.tag.rsplit("}", 1)[-1]
+                if tag == "sheet":
+                    names.append(element.get("name", ""))
+                elif tag == "sheets":
+                    break
+        return tuple(names)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_sheet_names_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Return the sheet names of a workbook; cached per file version."""
+    names = _read_sheet_names_from_zip(path_str)
+    if names is not None:
+        return names
+
+    with pd.ExcelFile(path_str, engine=_EXCEL_ENGINE) as excel_file:
+        return tuple(excel_file.sheet_names)
+
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Every character that can appear in str() of a non-missing number / timestamp
+_NUMERIC_TEXT_CHARS = frozenset("0123456789.-+einf")
+_DATETIME_TEXT_CHARS = frozenset("0123456789-:. +")
+
+# Lazily grown lookup table: _COL_LETTERS[n - 1] is the letter of column n
+_COL_LETTERS: List[str] = []
+_COL_LETTERS_LOCK = threading.Lock()
+
+
+def _column_letter(column: int) -> str:
+    """Return the Excel column letter for a 1-based column index."""
+    if column > len(_COL_LETTERS):
+        with _COL_LETTERS_LOCK:
+            while len(_COL_LETTERS) < column:
+                _COL_LETTERS.append(get_column_letter(len(_COL_LETTERS) + 1))
+    return _COL_LETTERS[column - 1]
+
 
 @dataclass
 class CellInfo:
@@ -26,10 +243,7 @@ class CellInfo:
 
     def __post_init__(self) -> None:
         if not self.address:
-            from openpyxl.utils import get_column_letter
-
-            column_letter = get_column_letter(self.column)
-            self.address = f"{column_letter}{self.row}"
+            self.address = f"{_column_letter(self.column)}{self.row}"
 
 
 @dataclass
@@ -45,23 +259,31 @@ class ExcelFileInfo:
 class ExcelReadTools:
     """Collection of Excel read helpers shared by the MCP server."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        records_factory: Optional[Callable[[pd.DataFrame], Sequence[Dict[Any, Any]]]] = None,
+    ) -> None:
         self.supported_formats = [".xlsx", ".xls", ".xlsm"]
+        # Builds the row records of a converted sheet; plain lists unless overridden
+        self.records_factory = records_factory or self._fast_records
 
-    def _validate_file(self, file_path: Union[str, Path]) -> Path:
-        """Verify that the supplied file exists and can be processed."""
-        path = Path(file_path)
+    def _inspect_file(self, file_path: Union[str, Path]) -> Tuple[Path, FileKey]:
+        """Validate the file and return it with its workbook cache key.
 
-        if not path.is_absolute():
-            raise ValueError("Please provide an absolute path to the Excel file.")
+        A single ``stat`` call both checks existence and identifies the file
+        version, so tools never stat the same file twice.
+        """
+        path, suffix = _resolve_path(file_path)
 
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
 
-        if path.suffix.lower() not in self.supported_formats:
+        if suffix not in self.supported_formats:
             raise ValueError(f"Unsupported file format: {path.suffix}")
 
-        return path
+        return path, (str(path), stat.st_mtime_ns, stat.st_size)
 
     @staticmethod
     def _convert_datetime_to_string(value: Any) -> str:
@@ -71,10 +293,10 @@ class ExcelReadTools:
                 return ""
 
             if isinstance(value, (datetime, pd.Timestamp)):
-                return value.strftime("%Y-%m-%d %H:%M:%S")
+                return value.strftime(DATETIME_FORMAT)
 
             if hasattr(value, "date") and callable(getattr(value, "date")):
-                return value.strftime("%Y-%m-%d %H:%M:%S")
+                return value.strftime(DATETIME_FORMAT)
 
             return str(value)
         except Exception as exc:  # pragma: no cover - defensive logging
@@ -82,37 +304,106 @@ class ExcelReadTools:
             return str(value) if value is not None else ""
 
     def _convert_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Return a DataFrame with datetime-like values stringified."""
+        """Return a DataFrame with datetime-like values stringified and blanks as None.
+
+        The input is returned as-is when there is nothing to convert, so callers
+        must treat the result as read-only.
+        """
         if df.empty:
-            return df.copy()
+            return df
+
+        # Complete numeric columns pass through untouched, so such sheets need no work
+        all_numeric = all(is_numeric_dtype(dtype) for dtype in df.dtypes)
+        if all_numeric and not df.isna().to_numpy().any():
+            return df
+
+        # Dispatch per column so only object columns pay for a Python call per cell
+        out = pd.DataFrame(index=df.index)
+        for position, column in enumerate(df.columns):
+            series = df.iloc[:, position]
+            if is_datetime64_any_dtype(series):
+                converted = series.dt.strftime(DATETIME_FORMAT)
+            elif is_numeric_dtype(series):
+                converted = series
+            elif infer_dtype(series, skipna=True) in ("string", "empty"):
+                # Text-only columns need no per-cell conversion
+                converted = series
+            else:
+                converted = series.map(self._convert_datetime_to_string)
+
+            # Blank cells are None in every column kind, so JSON always shows null
+            if series.hasnans:
+                converted = converted.astype(object).where(series.notna(), None)
+
+            out.insert(position, column, converted, allow_duplicates=True)
+
+        return out
+
+    @staticmethod
+    def _fast_records(df: pd.DataFrame) -> List[Dict[Any, Any]]:
+        """Equivalent of ``df.to_dict("records")`` built from whole-column lists."""
+        columns = df.columns.tolist()
+        arrays = [df.iloc[:, position].tolist() for position in range(len(columns))]
+        return [dict(zip(columns, row)) for row in zip(*arrays)]
+
+    def _load_sheets(self, path: Path, key: FileKey) -> Dict[str, pd.DataFrame]:
+        """Return every sheet of the workbook, parsing only those not yet cached."""
+        sheet_names, sheets = _workbook_cache.get(key)
+        if sheet_names is None or any(name not in sheets for name in sheet_names):
+            sheet_names, fresh = _read_missing_sheets(path, sheets)
+            _workbook_cache.put(key, sheet_names, fresh)
+            sheets.update(fresh)
+
+        return {name: sheets[name] for name in sheet_names}
+
+    def _load_sheet(
+        self,
+        path: Path,
+        key: FileKey,
+        sheet_name: Optional[str],
+    ) -> Tuple[str, pd.DataFrame]:
+        """Return one sheet (defaulting to the first), parsing only that sheet."""
+        sheet_names, sheets = _workbook_cache.get(key)
+        if sheet_names is not None:
+            sheet_name = self._resolve_sheet_name(sheet_names, sheet_name)
+            if sheet_name in sheets:
+                return sheet_name, sheets[sheet_name]
+
+        with pd.ExcelFile(path, engine=_EXCEL_ENGINE) as excel_file:
+            sheet_names = list(excel_file.sheet_names)
+            sheet_name = self._resolve_sheet_name(sheet_names, sheet_name)
+            df = excel_file.parse(sheet_name)
+
+        _workbook_cache.put(key, sheet_names, {sheet_name: df})
+        return sheet_name, df
+
+    @staticmethod
+    def _resolve_sheet_name(sheet_names: List[str], sheet_name: Optional[str]) -> str:
+        """Resolve ``sheet_name`` (defaulting to the first sheet) against the workbook."""
+        if sheet_name is None:
+            if not sheet_names:
+                raise ValueError("Workbook does not contain any sheets.")
+            return sheet_names[0]
 
-        # applymap is safe across pandas versions
-        return df.applymap(self._convert_datetime_to_string)
+        if sheet_name not in sheet_names:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+        return sheet_name
 
     def excel_read_info(self, file_path: str) -> Dict[str, Any]:
         """Return workbook level metadata."""
         try:
-            path = self._validate_file(file_path)
-            workbook = openpyxl.load_workbook(path, read_only=True)
+            path, key = self._inspect_file(file_path)
+            sheet_names = _read_sheet_names_cached(*key)
 
             file_info = ExcelFileInfo(
                 file_path=str(path),
-                file_size=path.stat().st_size,
-                sheet_count=len(workbook.sheetnames),
-                sheet_names=list(workbook.sheetnames),
+                file_size=key[2],
+                sheet_count=len(sheet_names),
+                sheet_names=list(sheet_names),
             )
 
-            workbook.close()
-
-            return {
-                "success": True,
-                "data": {
-                    "file_path": file_info.file_path,
-                    "file_size": file_info.file_size,
-                    "sheet_count": file_info.sheet_count,
-                    "sheet_names": file_info.sheet_names,
-                },
-            }
+            return {"success": True, "data": asdict(file_info)}
         except Exception as exc:
             logger.error("excel_read_info failed: %s", exc)
             return {"success": False, "error": str(exc)}
@@ -125,28 +416,99 @@ class ExcelReadTools:
     ) -> Dict[str, Any]:
         """Read a sheet (optionally a range) and return rows as dicts."""
         try:
-            path = self._validate_file(file_path)
-
-            df = pd.read_excel(path, sheet_name=sheet_name)
+            path, key = self._inspect_file(file_path)
 
             if range_spec:
-                logger.warning("range_spec is not currently implemented; returning full sheet.")
+                sheet_name, df = self._read_cell_range(path, key, sheet_name, range_spec)
+            else:
+                sheet_name, df = self._load_sheet(path, key, sheet_name)
 
             converted = self._convert_dataframe(df)
 
             return {
                 "success": True,
                 "data": {
-                    "sheet_name": sheet_name or getattr(df, "name", "Sheet1"),
+                    "sheet_name": sheet_name,
+                    "range_spec": range_spec,
                     "shape": converted.shape,
                     "columns": converted.columns.tolist(),
-                    "data": converted.to_dict("records"),
+                    "data": self.records_factory(converted),
                 },
             }
         except Exception as exc:
             logger.error("excel_read_range failed: %s", exc)
             return {"success": False, "error": str(exc)}
 
+    def _read_cell_range(
+        self,
+        path: Path,
+        key: FileKey,
+        sheet_name: Optional[str],
+        range_spec: str,
+    ) -> Tuple[str, pd.DataFrame]:
+        """Read only the cells of an A1-style range such as ``A1:C10``.
+
+        Columns are named by their letters since the range need not start at a
+        header row. Open-ended ranges (``A:C``, ``2:5``) are supported. Ranges
+        below the header row are sliced from the cached sheet when it is loaded.
+        """
+        min_col, min_row, max_col, max_row = range_boundaries(range_spec.strip())
+
+        sheet_names, sheets = _workbook_cache.get(key)
+        if sheet_names is None:
+            sheet_names = _read_sheet_names_cached(*key)
+        sheet_name = self._resolve_sheet_name(sheet_names, sheet_name)
+
+        # 0-based bounds; end_col is exclusive and None means open-ended
+        first_row = (min_row or 1) - 1
+        first_col = (min_col or 1) - 1
+        end_col = max_col
+
+        cached = sheets.get(sheet_name)
+        if cached is not None and first_row >= 1:
+            # Parsed row i holds Excel row i + 2 because row 1 became the header
+            df = cached.iloc[
+                first_row - 1 : None if max_row is None else max_row - 1,
+                first_col:end_col,
+            ]
+            # A direct read of a range without cells yields no rows and no columns
+            if df.empty:
+                df = pd.DataFrame()
+            df = self._reinfer_dtypes(df.reset_index(drop=True))
+            positions = range(first_col, first_col + len(df.columns))
+        else:
+            df = pd.read_excel(
+                path,
+                sheet_name=sheet_name,
+                header=None,
+                usecols=lambda position: (
+                    first_col <= position and (end_col is None or position < end_col)
+                ),
+                skiprows=first_row,
+                nrows=None if max_row is None else max_row - first_row,
+                engine=_EXCEL_ENGINE,
+            )
+            positions = df.columns
+
+        df.columns = [_column_letter(position + 1) for position in positions]
+
+        return sheet_name, df
+
+    @staticmethod
+    def _reinfer_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """Give a slice of a parsed sheet the dtypes a direct read would infer.
+
+        Column dtypes of the whole sheet can be wider than the slice needs, e.g.
+        float because of a blank elsewhere or object because of the header.
+        """
+        df = df.infer_objects()
+        for position in np.flatnonzero((df.dtypes == "float64").to_numpy()):
+            values = df.iloc[:, position].to_numpy()
+            # The readers turn integral cell values into ints
+            if values.size and np.isfinite(values).all() and (values % 1 == 0).all():
+                df.isetitem(position, values.astype("int64"))
+        return df
+
     def excel_read_all_sheets(
         self,
         file_path: str,
@@ -155,8 +517,8 @@ class ExcelReadTools:
     ) -> Dict[str, Any]:
         """Read every sheet in the workbook, optionally truncating rows."""
         try:
-            path = self._validate_file(file_path)
-            all_sheets = pd.read_excel(path, sheet_name=None)
+            path, key = self._inspect_file(file_path)
+            all_sheets = self._load_sheets(path, key)
 
             sheets_data: Dict[str, Any] = {}
             sheet_summary: List[Dict[str, Any]] = []
@@ -189,7 +551,7 @@ class ExcelReadTools:
                     sheets_data[sheet_name] = {
                         "shape": converted.shape,
                         "columns": converted.columns.tolist(),
-                        "data": converted.to_dict("records"),
+                        "data": self.records_factory(converted),
                         "truncated": original_rows > max_rows_per_sheet,
                         "original_rows": original_rows,
                     }
@@ -238,43 +600,29 @@ class ExcelReadTools:
     ) -> Dict[str, Any]:
         """Return workbook metadata plus a sample from every sheet."""
         try:
-            path = self._validate_file(file_path)
-            info = self.excel_read_info(file_path)
-            if not info.get("success"):
-                return info
-
-            all_sheets = pd.read_excel(path, sheet_name=None)
-            overview: List[Dict[str, Any]] = []
-
-            for sheet_name, df in all_sheets.items():
-                try:
-                    sample_df = df.head(sample_rows) if not df.empty else df
-                    converted_sample = self._convert_dataframe(sample_df)
+            path, key = self._inspect_file(file_path)
+
+            # Parse whole sheets rather than just the sample rows: samples then
+            # match the other tools' values, total_rows does not rely on the
+            # (optional) sheet dimension, and later calls hit the cache
+            all_sheets = self._load_sheets(path, key)
+            sheet_names = list(all_sheets)
+            overview = [
+                self._summarise_sheet(sheet_name, df.head(sample_rows), len(df), sample_rows)
+                for sheet_name, df in all_sheets.items()
+            ]
 
-                    overview.append(
-                        {
-                            "sheet_name": sheet_name,
-                            "total_rows": len(df),
-                            "total_columns": len(df.columns),
-                            "columns": df.columns.tolist(),
-                            "sample_data": converted_sample.to_dict("records"),
-                            "is_empty": df.empty,
-                            "has_more_data": len(df) > sample_rows,
-                        }
-                    )
-                except Exception as sheet_exc:
-                    logger.error("Failed to summarise sheet %s: %s", sheet_name, sheet_exc)
-                    overview.append(
-                        {
-                            "sheet_name": sheet_name,
-                            "error": str(sheet_exc),
-                        }
-                    )
+            file_info = ExcelFileInfo(
+                file_path=str(path),
+                file_size=key[2],
+                sheet_count=len(sheet_names),
+                sheet_names=sheet_names,
+            )
 
             return {
                 "success": True,
                 "data": {
-                    **info["data"],
+                    **asdict(file_info),
                     "sheets_overview": overview,
                     "sample_settings": {"sample_rows": sample_rows},
                 },
@@ -283,6 +631,33 @@ class ExcelReadTools:
             logger.error("excel_quick_overview failed: %s", exc)
             return {"success": False, "error": str(exc)}
 
+    def _summarise_sheet(
+        self,
+        sheet_name: str,
+        sample_df: pd.DataFrame,
+        total_rows: int,
+        sample_rows: int,
+    ) -> Dict[str, Any]:
+        """Build the overview entry for one sheet from its sampled rows."""
+        try:
+            converted_sample = self._convert_dataframe(sample_df)
+
+            return {
+                "sheet_name": sheet_name,
+                "total_rows": total_rows,
+                "total_columns": len(sample_df.columns),
+                "columns": sample_df.columns.tolist(),
+                "sample_data": self.records_factory(converted_sample),
+                "is_empty": total_rows == 0,
+                "has_more_data": total_rows > sample_rows,
+            }
+        except Exception as sheet_exc:
+            logger.error("Failed to summarise sheet %s: %s", sheet_name, sheet_exc)
+            return {
+                "sheet_name": sheet_name,
+                "error": str(sheet_exc),
+            }
+
     def excel_search(
         self,
         file_path: str,
@@ -291,16 +666,14 @@ class ExcelReadTools:
     ) -> Dict[str, Any]:
         """Search for a term across the workbook (or a single sheet)."""
         try:
-            path = self._validate_file(file_path)
+            path, key = self._inspect_file(file_path)
             results: List[Dict[str, Any]] = []
 
             if sheet_name:
-                df = pd.read_excel(path, sheet_name=sheet_name)
+                sheet_name, df = self._load_sheet(path, key, sheet_name)
                 results.extend(self._search_in_dataframe(df, search_term, sheet_name))
             else:
-                excel_file = pd.ExcelFile(path)
-                for sheet in excel_file.sheet_names:
-                    df = pd.read_excel(path, sheet_name=sheet)
+                for sheet, df in self._load_sheets(path, key).items():
                     results.extend(self._search_in_dataframe(df, search_term, sheet))
 
             return {
@@ -324,26 +697,81 @@ class ExcelReadTools:
         """Perform a case-insensitive search within a DataFrame."""
         matches: List[Dict[str, Any]] = []
         lowered_term = search_term.lower()
+        hits: List[Tuple[int, int, Any]] = []
+
+        # Terms using characters that numbers/timestamps never render cannot match them
+        term_chars = set(lowered_term)
+        term_may_be_numeric = term_chars <= _NUMERIC_TEXT_CHARS
+        term_may_be_datetime = term_chars <= _DATETIME_TEXT_CHARS
+
+        # Scan column by column; only matching cells are boxed into Python objects
+        for col_idx in range(len(df.columns)):
+            series = df.iloc[:, col_idx]
+            if series.dtype.kind in "iuf" and not term_may_be_numeric:
+                continue
+            if is_datetime64_any_dtype(series) and not term_may_be_datetime:
+                continue
+
+            try:
+                mask = self._match_column(series, lowered_term)
+                row_positions = np.flatnonzero(mask).tolist()
+                values = series.iloc[row_positions].tolist()
+            except Exception as exc:  # pragma: no cover - defensive fallback
+                logger.debug("Vectorised search failed for column %s: %s", col_idx, exc)
+                row_positions, values = [], []
+                for row_pos, value in enumerate(series.tolist()):
+                    if pd.notna(value) and lowered_term in str(value).lower():
+                        row_positions.append(row_pos)
+                        values.append(value)
+
+            hits.extend(
+                (row_pos, col_idx, value) for row_pos, value in zip(row_positions, values)
+            )
 
-        for row_idx, row in df.iterrows():
-            for col_idx, value in enumerate(row):
-                if pd.notna(value) and lowered_term in str(value).lower():
-                    converted_value = self._convert_datetime_to_string(value)
-                    cell_info = CellInfo(
-                        row=row_idx + 2,
-                        column=col_idx + 1,
-                        value=converted_value,
-                        sheet_name=sheet_name,
-                    )
-                    matches.append(
-                        {
-                            "sheet_name": cell_info.sheet_name,
-                            "address": cell_info.address,
-                            "row": cell_info.row,
-                            "column": cell_info.column,
-                            "value": str(cell_info.value),
-                            "column_name": df.columns[col_idx],
-                        }
-                    )
+        # Report matches in sheet reading order (row-major)
+        hits.sort(key=lambda hit: (hit[0], hit[1]))
+
+        for row_pos, col_idx, value in hits:
+            cell_info = CellInfo(
+                row=row_pos + 2,
+                column=col_idx + 1,
+                value=self._convert_datetime_to_string(value),
+                sheet_name=sheet_name,
+                address=f"{_column_letter(col_idx + 1)}{row_pos + 2}",
+            )
+            matches.append(
+                {
+                    "sheet_name": cell_info.sheet_name,
+                    "address": cell_info.address,
+                    "row": cell_info.row,
+                    "column": cell_info.column,
+                    "value": str(cell_info.value),
+                    "column_name": df.columns[col_idx],
+                }
+            )
 
         return matches
+
+    @staticmethod
+    def _match_column(series: pd.Series, lowered_term: str) -> np.ndarray:
+        """Return a mask of the non-missing cells whose text contains ``lowered_term``."""
+        dtype = series.dtype
+
+        # Plain NumPy numbers render in lower case, so no case folding is needed
+        if isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+            values = series.to_numpy()
+            mask = np.char.find(values.astype(str), lowered_term) >= 0
+            if dtype.kind == "f":
+                mask &= ~np.isnan(values)
+            return mask
+
+        # Match timestamps in the same format they are reported in
+        if is_datetime64_any_dtype(series):
+            text = series.dt.strftime(DATETIME_FORMAT).fillna("").to_numpy(dtype=str)
+            return (np.char.find(text, lowered_term) >= 0) & series.notna().to_numpy()
+
+        # Fold case with str.lower() like the other branches, not pandas' casefold
+        mask = series.notna() & series.astype(str).str.lower().str.contains(
+            lowered_term, regex=False, na=False
+        )
+        return mask.to_numpy(dtype=bool)
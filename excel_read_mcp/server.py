@@ -5,24 +5,100 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Union
 
+import pandas as pd
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from .core import ExcelReadTools
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
+def _iter_records(df: pd.DataFrame) -> Iterator[Dict[Any, Any]]:
+    """Yield ``df.to_dict("records")`` rows built from whole-column lists."""
+    columns = df.columns.tolist()
+    arrays = [df.iloc[:, position].tolist() for position in range(len(columns))]
+    for row in zip(*arrays):
+        yield dict(zip(columns, row))
+
+
+class LazyRecords(Sequence):
+    """Read-only sequence of row dicts materialised from a DataFrame on demand.
+
+    Passed to ``ExcelReadTools`` as its records factory so large sheets stay
+    as columns until the JSON encoder reaches them, instead of holding a
+    second copy as a list of dicts. The encoders expand them through the
+    ``default`` hooks below.
+    """
+
+    __slots__ = ("_df",)
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def __iter__(self) -> Iterator[Dict[Any, Any]]:
+        return _iter_records(self._df)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return list(_iter_records(self._df.iloc[index]))
+        return next(_iter_records(self._df.iloc[[index]]))
+
+    def __repr__(self) -> str:
+        return f"LazyRecords(rows={len(self)})"
+
+
+def _json_default(value: Any) -> Any:
+    """Expand lazily built sheet records while the encoder reaches them."""
+    if isinstance(value, LazyRecords):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_default(value: Any) -> Any:
+    """Encode sheet records into a compact, pre-serialised fragment.
+
+    Indenting every row roughly doubles the response for large sheets, so
+    records are embedded without indentation. ``orjson.Fragment`` needs
+    orjson 3.10+; older versions fall back to the indented list.
+    """
+    if isinstance(value, LazyRecords) and hasattr(orjson, "Fragment"):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.Fragment(orjson.dumps(list(value), option=option))
+    return _json_default(value)
+
+
+def _dumps(result: Dict[str, Any]) -> str:
+    """Serialise a tool result, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            result,
+            default=_orjson_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode("utf-8")
+
+    return json.dumps(result, ensure_ascii=False, indent=2, default=_json_default)
+
+
 class ExcelReadMCPServer:
     """Server wiring ExcelReadTools into the Model Context Protocol."""
 
     def __init__(self) -> None:
         self.server = Server("excel-read-tools")
-        self.tools = ExcelReadTools()
+        self.tools = ExcelReadTools(records_factory=LazyRecords)
         self._register_tools()
 
     def _register_tools(self) -> None:
@@ -168,7 +244,7 @@ class ExcelReadMCPServer:
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(result, ensure_ascii=False, indent=2),
+                        text=_dumps(result),
                     )
                 ]
             except Exception as exc:
@@ -177,7 +253,7 @@ class ExcelReadMCPServer:
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(error_result, ensure_ascii=False, indent=2),
+                        text=_dumps(error_result),
                     )
                 ]
 